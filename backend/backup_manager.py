@@ -1,10 +1,12 @@
+import json
 import os
-import subprocess
+import shutil
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Dict, List, Optional
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient
 
 logger = logging.getLogger(__name__)
 
@@ -15,25 +17,43 @@ class BackupManager:
         self.mongodb_uri = mongodb_uri
         self.backup_dir = backup_dir
         os.makedirs(backup_dir, exist_ok=True)
+        # Maps backup path -> (st_mtime_ns, size); mongodump writes a backup
+        # once and never mutates it, so cached sizes stay valid. Persisted to
+        # disk so restarts don't re-walk legacy backup trees.
+        self._size_cache_file = os.path.join(backup_dir, ".sizes.json")
+        self._size_cache: Dict[str, tuple] = self._load_size_cache()
+        self._size_cache_dirty = False
     
+    async def _run_command(self, cmd: List[str]) -> tuple:
+        """Run a command without blocking the event loop, returning (returncode, stderr)"""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+        return proc.returncode, stderr.decode(errors="replace")
+
     async def create_backup(self, database_name: str = "postnatal_stories") -> Dict:
         """Create MongoDB backup"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = os.path.join(self.backup_dir, f"backup_{timestamp}")
-            
-            # Use mongodump command
+            backup_path = os.path.join(self.backup_dir, f"backup_{timestamp}.gz")
+
+            # Stream a single compressed archive instead of a directory tree
+            # of per-collection BSON files
             cmd = [
                 "mongodump",
                 "--uri", self.mongodb_uri,
                 "--db", database_name,
-                "--out", backup_path
+                "--gzip",
+                f"--archive={backup_path}"
             ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                logger.info(f"Backup created successfully: {backup_path}")
+
+            returncode, stderr = await self._run_command(cmd)
+
+            if returncode == 0:
+                logger.info("Backup created successfully: %s", backup_path)
                 return {
                     "success": True,
                     "backup_path": backup_path,
@@ -41,15 +61,15 @@ class BackupManager:
                     "message": "Backup created successfully"
                 }
             else:
-                logger.error(f"Backup failed: {result.stderr}")
+                logger.error("Backup failed: %s", stderr)
                 return {
                     "success": False,
-                    "error": result.stderr,
+                    "error": stderr,
                     "message": "Backup failed"
                 }
                 
         except Exception as e:
-            logger.error(f"Backup error: {e}")
+            logger.error("Backup error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -59,76 +79,113 @@ class BackupManager:
     async def restore_backup(self, backup_path: str, database_name: str = "postnatal_stories") -> Dict:
         """Restore MongoDB backup"""
         try:
-            cmd = [
-                "mongorestore",
-                "--uri", self.mongodb_uri,
-                "--db", database_name,
-                "--drop",  # Drop existing collections
-                os.path.join(backup_path, database_name)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                logger.info(f"Restore completed successfully from: {backup_path}")
+            if backup_path.endswith(".gz"):
+                cmd = [
+                    "mongorestore",
+                    "--uri", self.mongodb_uri,
+                    "--drop",  # Drop existing collections
+                    "--gzip",
+                    f"--archive={backup_path}",
+                    f"--nsInclude={database_name}.*"
+                ]
+            else:
+                # Legacy directory-tree backup
+                cmd = [
+                    "mongorestore",
+                    "--uri", self.mongodb_uri,
+                    "--db", database_name,
+                    "--drop",  # Drop existing collections
+                    os.path.join(backup_path, database_name)
+                ]
+
+            returncode, stderr = await self._run_command(cmd)
+
+            if returncode == 0:
+                logger.info("Restore completed successfully from: %s", backup_path)
                 return {
                     "success": True,
                     "message": "Database restored successfully"
                 }
             else:
-                logger.error(f"Restore failed: {result.stderr}")
+                logger.error("Restore failed: %s", stderr)
                 return {
                     "success": False,
-                    "error": result.stderr,
+                    "error": stderr,
                     "message": "Restore failed"
                 }
                 
         except Exception as e:
-            logger.error(f"Restore error: {e}")
+            logger.error("Restore error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Restore failed"
             }
     
-    def list_backups(self) -> List[Dict]:
+    async def list_backups(self) -> List[Dict]:
         """List available backups"""
         backups = []
         try:
-            for item in os.listdir(self.backup_dir):
-                if item.startswith("backup_"):
-                    backup_path = os.path.join(self.backup_dir, item)
-                    if os.path.isdir(backup_path):
-                        stat = os.stat(backup_path)
-                        backups.append({
-                            "name": item,
-                            "path": backup_path,
-                            "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                            "size_mb": round(self._get_directory_size(backup_path) / (1024*1024), 2)
-                        })
-            
+            entries = []
+            with os.scandir(self.backup_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith("backup_"):
+                        continue
+                    if entry.name.endswith(".gz") and entry.is_file(follow_symlinks=False):
+                        entries.append((entry.name, entry.path, entry.stat(), False))
+                    elif entry.is_dir(follow_symlinks=False):
+                        # Legacy directory-tree backup
+                        entries.append((entry.name, entry.path, entry.stat(), True))
+
+            # Archives cost one stat; legacy directory walks are blocking I/O,
+            # so run those concurrently off the event loop
+            sizes = await asyncio.gather(*[
+                self._backup_size(path, stat, is_dir)
+                for _, path, stat, is_dir in entries
+            ])
+
+            for (name, path, stat, _), size in zip(entries, sizes):
+                backups.append({
+                    "name": name,
+                    "path": path,
+                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                    "ctime": stat.st_ctime,
+                    "size_mb": round(size / (1024*1024), 2)
+                })
+
             # Sort by creation time (newest first)
-            backups.sort(key=lambda x: x["created"], reverse=True)
-            
+            backups.sort(key=itemgetter("created"), reverse=True)
+
+            if self._size_cache_dirty:
+                await asyncio.to_thread(self._save_size_cache)
+
         except Exception as e:
-            logger.error(f"Error listing backups: {e}")
-        
+            logger.error("Error listing backups: %s", e)
+
         return backups
-    
-    def cleanup_old_backups(self, keep_days: int = 30) -> Dict:
+
+    async def cleanup_old_backups(self, keep_days: int = 30) -> Dict:
         """Remove backups older than specified days"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=keep_days)
-            removed_count = 0
-            
-            for backup in self.list_backups():
-                backup_date = datetime.fromisoformat(backup["created"])
-                if backup_date < cutoff_date:
-                    backup_path = backup["path"]
-                    subprocess.run(["rm", "-rf", backup_path])
-                    removed_count += 1
-                    logger.info(f"Removed old backup: {backup['name']}")
-            
+            cutoff_ts = (datetime.now() - timedelta(days=keep_days)).timestamp()
+
+            stale = [b for b in await self.list_backups() if b["ctime"] < cutoff_ts]
+
+            # Each removal is independent I/O; delete the stale backups
+            # concurrently instead of waiting on them one at a time
+            await asyncio.gather(*[
+                asyncio.to_thread(self._remove_backup_path, backup["path"])
+                for backup in stale
+            ])
+
+            for backup in stale:
+                self._size_cache.pop(backup["path"], None)
+                logger.info("Removed old backup: %s", backup["name"])
+
+            if stale:
+                await asyncio.to_thread(self._save_size_cache)
+
+            removed_count = len(stale)
             return {
                 "success": True,
                 "removed_count": removed_count,
@@ -136,20 +193,82 @@ class BackupManager:
             }
             
         except Exception as e:
-            logger.error(f"Cleanup error: {e}")
+            logger.error("Cleanup error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Cleanup failed"
             }
     
+    def _remove_backup_path(self, path: str):
+        """Remove a backup archive or legacy backup directory"""
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    async def _backup_size(self, path: str, stat: os.stat_result, is_dir: bool) -> int:
+        """Size of a backup: one stat for archives, a cached walk for legacy trees"""
+        if not is_dir:
+            return stat.st_size
+        return await asyncio.to_thread(self._get_cached_directory_size, path, stat.st_mtime_ns)
+
+    def _get_cached_directory_size(self, path: str, mtime_ns: int) -> int:
+        """Get directory size, reusing the cached value for unchanged backups"""
+        cached = self._size_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        size = self._get_directory_size(path)
+        self._size_cache[path] = (mtime_ns, size)
+        self._size_cache_dirty = True
+        return size
+
+    def _load_size_cache(self) -> Dict[str, tuple]:
+        """Load the persisted size cache, tolerating a missing or corrupt file"""
+        try:
+            with open(self._size_cache_file) as f:
+                raw = json.load(f)
+            return {path: tuple(entry) for path, entry in raw.items()}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_size_cache(self):
+        """Persist the size cache atomically (temp file + fsync + os.replace)"""
+        tmp_path = f"{self._size_cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self._size_cache, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._size_cache_file)
+        except OSError as e:
+            logger.warning("Could not persist backup size cache: %s", e)
+        self._size_cache_dirty = False
+
     def _get_directory_size(self, path: str) -> int:
         """Get directory size in bytes"""
         total = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                total += os.path.getsize(filepath)
+        stack = deque([path])
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                # DirEntry caches the stat from readdir, so this
+                                # avoids a second stat() syscall per file
+                                total += entry.stat(follow_symlinks=False).st_size
+                            elif entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                        except OSError:
+                            continue
+            except PermissionError:
+                continue
         return total
 
 # Backup scheduler
@@ -159,38 +278,58 @@ class BackupScheduler:
     def __init__(self, backup_manager: BackupManager):
         self.backup_manager = backup_manager
         self.running = False
+        self._backup_lock = asyncio.Lock()
+        self._current_backup: Optional[asyncio.Task] = None
     
     async def start_daily_backup(self, hour: int = 2):
-        """Start daily backup at specified hour"""
+        """Start daily backup at specified hour (UTC)"""
         self.running = True
-        logger.info(f"Starting daily backup scheduler at {hour}:00")
-        
+        logger.info("Starting daily backup scheduler at %s:00 UTC", hour)
+        last_run_date = None
+
         while self.running:
-            now = datetime.now()
+            now = datetime.now(timezone.utc)
             next_backup = now.replace(hour=hour, minute=0, second=0, microsecond=0)
-            
+
             # If we've passed today's backup time, schedule for tomorrow
             if now >= next_backup:
                 next_backup += timedelta(days=1)
-            
-            # Wait until backup time
-            wait_seconds = (next_backup - now).total_seconds()
-            logger.info(f"Next backup scheduled for: {next_backup}")
-            
-            await asyncio.sleep(wait_seconds)
-            
-            if self.running:  # Check if still running after sleep
-                logger.info("Starting scheduled backup...")
-                result = await self.backup_manager.create_backup()
-                
-                if result["success"]:
-                    logger.info("Scheduled backup completed successfully")
-                    # Cleanup old backups
-                    self.backup_manager.cleanup_old_backups()
-                else:
-                    logger.error(f"Scheduled backup failed: {result['message']}")
+
+            logger.info("Next backup scheduled for: %s", next_backup)
+
+            # Sleep in bounded increments and re-check the clock, so suspend,
+            # DST shifts or NTP jumps can't skip a day or fire early
+            while self.running:
+                now = datetime.now(timezone.utc)
+                if now >= next_backup:
+                    break
+                await asyncio.sleep(min(60, (next_backup - now).total_seconds()))
+
+            if self.running and last_run_date != next_backup.date():
+                last_run_date = next_backup.date()
+                if self._backup_lock.locked():
+                    logger.warning("Backup already running, skipping this trigger")
+                    continue
+                # Run as a tracked task so the scheduler keeps responding to
+                # stop() while a long backup is in flight
+                self._current_backup = asyncio.create_task(self._run_backup())
+
+    async def _run_backup(self):
+        """Execute a single backup + cleanup cycle under the single-flight lock"""
+        async with self._backup_lock:
+            logger.info("Starting scheduled backup...")
+            result = await self.backup_manager.create_backup()
+
+            if result["success"]:
+                logger.info("Scheduled backup completed successfully")
+                # Cleanup old backups
+                await self.backup_manager.cleanup_old_backups()
+            else:
+                logger.error("Scheduled backup failed: %s", result["message"])
     
     def stop(self):
         """Stop the backup scheduler"""
         self.running = False
+        if self._current_backup and not self._current_backup.done():
+            self._current_backup.cancel()
         logger.info("Backup scheduler stopped")
\ No newline at end of file
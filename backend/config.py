@@ -1,5 +1,6 @@
 # config.py - Environment configuration
 import os
+from functools import cached_property, lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
@@ -45,11 +46,11 @@ class Settings(BaseSettings):
     similarity_threshold: float = 0.1
     max_similar_stories: int = 9
     
-    @field_validator('allowed_origins')
-    @classmethod
-    def parse_origins(cls, v):
-        return [origin.strip() for origin in v.split(',')]
-    
+    @cached_property
+    def allowed_origins_list(self) -> list:
+        """Parsed CORS origins; computed once, keeps allowed_origins a plain str"""
+        return [origin.strip() for origin in self.allowed_origins.split(',') if origin.strip()]
+
     @field_validator('jwt_secret_key')
     @classmethod
     def validate_secret_key(cls, v):
@@ -69,9 +70,12 @@ class ProductionSettings(Settings):
     debug: bool = False
     log_level: str = "WARNING"
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    # Cached so repeated calls (FastAPI DI, routers) don't re-read .env and
+    # re-run every validator; use get_settings.cache_clear() in tests
     env = os.getenv("ENVIRONMENT", "development").lower()
-    
+
     if env == "production":
         return ProductionSettings()
     else:
@@ -1,13 +1,33 @@
-from .connection import connect_to_mongo, close_mongo_connection, mongodb
-from .models.users import UserDatabase
-from .models.story import StoryDatabase
-from .utils import CrisisSupport
-from .connection import mongodb
+import importlib
+
+from .connection import connect_to_mongo, close_mongo_connection, check_database_health, mongodb
+
+# Model and utility classes are resolved lazily (PEP 562) so importing the
+# package for the connection doesn't eagerly load every model module
+_LAZY_IMPORTS = {
+    'UserDatabase': '.models.users',
+    'StoryDatabase': '.models.story',
+    'ModerationDatabase': '.models.moderation',
+    'SavedStoriesDatabase': '.models.saved_stories',
+    'CrisisSupport': '.utils',
+}
 
 __all__ = [
     'connect_to_mongo',
     'close_mongo_connection',
+    'check_database_health',
+    'mongodb',
     'UserDatabase',
     'StoryDatabase',
+    'ModerationDatabase',
+    'SavedStoriesDatabase',
     'CrisisSupport',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_path = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_path, __name__), name)
@@ -1,6 +1,8 @@
+import asyncio
 import os
+import time
 import logging
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 from pymongo.errors import ConnectionFailure
 
 logger = logging.getLogger(__name__)
@@ -8,8 +10,24 @@ logger = logging.getLogger(__name__)
 MONGODB_URI = os.getenv("MONGODB_URI")
 DATABASE_NAME = "postnatal_stories"
 
+# Connection pool tuning - bounds connections per worker process instead of
+# relying on driver defaults (maxPoolSize=100, minPoolSize=0, which thrash
+# open new TCP+TLS connections under burst traffic).
+#
+# Operator knobs, all per process:
+#   MONGO_MAX_POOL_SIZE            upper bound on pooled connections. Under
+#                                  gunicorn, mongod sees workers * this
+#                                  value - divide accordingly.
+#   MONGO_MIN_POOL_SIZE            connections kept warm so a burst after
+#                                  idle doesn't pay connection setup.
+#   MONGO_SERVER_SELECTION_TIMEOUT_MS  how long to wait for a reachable
+#                                  server before failing the operation.
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "4"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "3000"))
+
 class MongoDB:
-    client: AsyncIOMotorClient = None
+    client: AsyncMongoClient = None
     database = None
 
 mongodb = MongoDB()
@@ -19,7 +37,19 @@ async def connect_to_mongo():
     if not MONGODB_URI:
         raise ValueError("MONGODB_URI environment variable not set")
         
-    mongodb.client = AsyncIOMotorClient(MONGODB_URI)
+    mongodb.client = AsyncMongoClient(
+        MONGODB_URI,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=MONGO_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        maxIdleTimeMS=60000,
+        waitQueueTimeoutMS=2000,
+        retryWrites=True,
+        appname="postnatal-stories-api",
+        # Stories are large text blobs; wire compression cuts the bytes per
+        # batch substantially. The server picks the first codec it supports.
+        compressors="zstd,snappy,zlib",
+    )
     mongodb.database = mongodb.client[DATABASE_NAME]
     
     await mongodb.client.admin.command('ping')
@@ -31,39 +61,123 @@ async def connect_to_mongo():
 async def close_mongo_connection():
     """Close database connection"""
     if mongodb.client:
-        mongodb.client.close()
+        await mongodb.client.close()
         logger.info("Disconnected from MongoDB")
 
+# (collection, keys, options) for every index the app relies on
+INDEX_SPECS = [
+    ("users", [("email", 1)], {"unique": True}),
+    # Partial indexes: only users with an active reset token are indexed,
+    # so token verification and the expiry sweep never scan the collection
+    ("users", [("reset_token", 1)], {
+        "partialFilterExpression": {"reset_token": {"$type": "string"}},
+        "name": "reset_token_partial",
+    }),
+    ("users", [("reset_token_expires", 1)], {
+        "partialFilterExpression": {"reset_token_expires": {"$type": "date"}},
+        "name": "reset_token_expires_partial",
+    }),
+    ("pending_stories", [("status", 1), ("created_at", 1)], {}),
+    ("pending_stories", [("risk_level", 1), ("status", 1), ("created_at", -1)], {}),
+    ("approved_stories", [
+        ("challenge", "text"), ("experience", "text"),
+        ("solution", "text"), ("generated_story", "text")
+    ], {
+        # Weighted so matches in the challenge/solution outrank body text
+        "weights": {"challenge": 10, "solution": 5, "experience": 3, "generated_story": 1},
+        "default_language": "english",
+        "name": "stories_text_v2",
+    }),
+    ("approved_stories", [("created_at", -1)], {}),
+    # Keyset pagination: (created_at, _id) makes the before-token walk and
+    # its tie-break sort a pure index scan
+    ("approved_stories", [("created_at", -1), ("_id", -1)], {}),
+
+    # Indexes for rejected stories collection
+    ("rejected_stories", [("user_id", 1), ("created_at", -1)], {}),
+    ("rejected_stories", [("status", 1), ("created_at", 1)], {}),
+
+    # Indexes for saved stories
+    ("saved_stories", [("user_id", 1), ("story_id", 1)], {"unique": True}),
+    ("saved_stories", [("user_id", 1), ("saved_at", -1)], {}),
+    ("saved_stories", [("story_id", 1)], {}),
+]
+
+def _default_index_name(keys) -> str:
+    """Mirror the server's default index naming (field_direction pairs)"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+async def _existing_index_names(collection_name: str) -> set:
+    """Get the names of indexes that already exist on a collection"""
+    try:
+        cursor = await mongodb.database[collection_name].list_indexes()
+        return {index["name"] async for index in cursor}
+    except Exception:
+        # Collection doesn't exist yet; every index needs creating
+        return set()
+
+# Name of the unweighted text index created by earlier releases
+_LEGACY_TEXT_INDEX = "challenge_text_experience_text_solution_text_generated_story_text"
+
 async def create_indexes():
-    """Create database indexes"""
-    try:        
-        await mongodb.database.users.create_index([("email", 1)], unique=True)
-        await mongodb.database.pending_stories.create_index([("status", 1), ("created_at", 1)])
-        await mongodb.database.approved_stories.create_index([
-            ("challenge", "text"), ("experience", "text"), 
-            ("solution", "text"), ("generated_story", "text")
-        ])
-        await mongodb.database.approved_stories.create_index([("created_at", -1)])
-        
-        # Add indexes for rejected stories collection
-        await mongodb.database.rejected_stories.create_index([("user_id", 1), ("created_at", -1)])
-        await mongodb.database.rejected_stories.create_index([("status", 1), ("created_at", 1)])
-
-        # Add indexes for saved stories
-        await mongodb.database.saved_stories.create_index([("user_id", 1), ("story_id", 1)], unique=True)
-        await mongodb.database.saved_stories.create_index([("user_id", 1), ("saved_at", -1)])
-        await mongodb.database.saved_stories.create_index([("story_id", 1)])
-        
+    """Create any database indexes that don't exist yet"""
+    collection_names = {collection for collection, _, _ in INDEX_SPECS}
+    existing = dict(zip(collection_names, await asyncio.gather(
+        *[_existing_index_names(name) for name in collection_names]
+    )))
+
+    # Only one text index is allowed per collection, so drop the old
+    # unweighted one before the weighted replacement can be created
+    if ("stories_text_v2" not in existing["approved_stories"]
+            and _LEGACY_TEXT_INDEX in existing["approved_stories"]):
+        await mongodb.database.approved_stories.drop_index(_LEGACY_TEXT_INDEX)
+
+    # Only issue create_index for specs the server doesn't already have, and
+    # run the remainder concurrently so startup pays one RTT, not the sum
+    tasks = [
+        mongodb.database[collection].create_index(keys, **options)
+        for collection, keys, options in INDEX_SPECS
+        if options.get("name", _default_index_name(keys)) not in existing[collection]
+    ]
+    if not tasks:
+        logger.info("Database indexes already up to date")
+        return
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    for failure in failures:
+        logger.warning("Could not create index: %s", failure)
+    if not failures:
         logger.info("Database indexes created successfully")
-    except Exception as e:
-        logger.warning(f"Could not create indexes: {e}")
+
+# Health probes arrive in bursts from load balancers; cache the ping result
+# briefly and single-flight concurrent refreshes
+_HEALTH_CACHE_TTL = 2.0
+_health_cache = {"checked_at": 0.0, "healthy": False}
+_health_lock = asyncio.Lock()
 
 async def check_database_health() -> bool:
     """Check database connection health"""
-    try:
-        if mongodb.client is None:
-            return False
-        await mongodb.client.admin.command('ping')
-        return True
-    except Exception:
-        return False
\ No newline at end of file
+    now = time.monotonic()
+    if now - _health_cache["checked_at"] < _HEALTH_CACHE_TTL:
+        return _health_cache["healthy"]
+
+    async with _health_lock:
+        # Another probe may have refreshed while we waited for the lock
+        now = time.monotonic()
+        if now - _health_cache["checked_at"] < _HEALTH_CACHE_TTL:
+            return _health_cache["healthy"]
+
+        try:
+            if mongodb.client is None:
+                healthy = False
+            else:
+                await mongodb.client.admin.command('ping')
+                healthy = True
+        except Exception:
+            healthy = False
+
+        _health_cache["checked_at"] = time.monotonic()
+        _health_cache["healthy"] = healthy
+        return healthy
\ No newline at end of file
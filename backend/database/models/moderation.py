@@ -1,8 +1,11 @@
 # backend/database/models/moderation.py
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+from bson import ObjectId
 from ..connection import mongodb
+from ..utils import ContentFilter, CrisisSupport
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +26,11 @@ class ModerationDatabase:
         embedding: Optional[List[float]] = None
     ) -> Dict[str, Any]:
         """Submit story for moderation review"""
-        
+
+        # One linear scan over the combined text; sync on purpose, no I/O
+        combined_text = " ".join(filter(None, [challenge, experience, solution, advice, generated_story]))
+        risk = ContentFilter.assess_risk(combined_text)
+
         story_doc = {
             "content_type": "story",  
             "user_id": user_id,
@@ -37,12 +44,25 @@ class ModerationDatabase:
             "key_symptoms": key_symptoms,
             "embedding": embedding, 
             "status": "pending_review",
+            # Derived at write time so dashboards never re-scan the text
+            "risk_level": risk["risk_level"],
+            "flagged_keywords": risk["flagged_keywords"],
+            "word_count": len(combined_text.split()),
             "created_at": datetime.utcnow(),
             "approved_by": None,
             "approved_at": None
         }
         
-        result = await mongodb.database.pending_stories.insert_one(story_doc)
+        if risk["risk_level"] == "high":
+            # The crisis log is independent of the insert, so run both
+            # concurrently; log_crisis_interaction swallows its own errors,
+            # so a logging failure can never block the submission
+            result, _ = await asyncio.gather(
+                mongodb.database.pending_stories.insert_one(story_doc),
+                CrisisSupport.log_crisis_interaction("high_risk_story_submission", user_id),
+            )
+        else:
+            result = await mongodb.database.pending_stories.insert_one(story_doc)
         return {
             "success": True,
             "message": "Story submitted for review",
@@ -53,15 +73,77 @@ class ModerationDatabase:
     @staticmethod
     async def get_pending_stories(limit: int = 50) -> List[Dict[str, Any]]:
         """Get pending stories for moderation"""
+        # The server does the ObjectId->string conversion and drops the
+        # embedding in-transit, so no per-document Python loop is needed
+        pipeline = [
+            {"$match": {"status": "pending_review"}},
+            {"$sort": {"created_at": 1}},
+            {"$limit": limit},
+            {"$addFields": {"id": {"$toString": "$_id"}}},
+            {"$unset": ["_id", "embedding"]},
+        ]
+        cursor = await mongodb.database.pending_stories.aggregate(pipeline)
+        return await cursor.to_list(length=limit)
+
+    @staticmethod
+    async def move_story(story_id: str, destination: str, extra_fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Move a pending story to another collection (approve/reject)"""
+        # find_one_and_delete fetches and removes in one round-trip; if the
+        # destination insert fails the story is put back so the action can
+        # be retried
+        story = await mongodb.database.pending_stories.find_one_and_delete(
+            {"_id": ObjectId(story_id)}
+        )
+        if story is None:
+            return None
+
+        moved = {**story, **extra_fields}
+        try:
+            await mongodb.database[destination].insert_one(moved)
+        except Exception:
+            await mongodb.database.pending_stories.insert_one(story)
+            raise
+        return moved
+
+    @staticmethod
+    async def bulk_move_stories(story_ids: List[str], destination: str, extra_fields: Dict[str, Any]) -> int:
+        """Move a batch of pending stories in one fetch/insert/delete."""
+        object_ids = [ObjectId(story_id) for story_id in story_ids if ObjectId.is_valid(story_id)]
+        if not object_ids:
+            return 0
+
+        stories = await mongodb.database.pending_stories.find(
+            {"_id": {"$in": object_ids}}
+        ).to_list(length=len(object_ids))
+        if not stories:
+            return 0
+
+        await mongodb.database[destination].insert_many(
+            [{**story, **extra_fields} for story in stories],
+            ordered=False
+        )
+        await mongodb.database.pending_stories.delete_many(
+            {"_id": {"$in": [story["_id"] for story in stories]}}
+        )
+        return len(stories)
+
+    @staticmethod
+    async def get_stories_by_ids(story_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get multiple pending stories in a single round-trip"""
+        # One $in query instead of a find_one per id
+        if not story_ids:
+            return []
+
+        object_ids = [ObjectId(story_id) for story_id in story_ids if ObjectId.is_valid(story_id)]
+        if not object_ids:
+            return []
+
         cursor = mongodb.database.pending_stories.find(
-            {"status": "pending_review"}
-        ).limit(limit).sort("created_at", 1)
-        
-        stories = []
-        async for story in cursor:
-            story["id"] = str(story["_id"])
-            story.pop("embedding", None)
-            del story["_id"]
-            stories.append(story)
-        
+            {"_id": {"$in": object_ids}},
+            {"embedding": 0}
+        ).batch_size(len(object_ids))
+
+        stories = await cursor.to_list(length=len(object_ids))
+        for story in stories:
+            story["id"] = str(story.pop("_id"))
         return stories
\ No newline at end of file
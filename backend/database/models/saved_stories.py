@@ -6,43 +6,71 @@ from ..connection import mongodb
 
 logger = logging.getLogger(__name__)
 
+# Story fields the saved-stories UI renders, snapshotted into the save
+# document so reads never need a $lookup join
+_STORY_SNAPSHOT_FIELDS = {
+    "_id": 0,
+    "challenge": 1,
+    "experience": 1,
+    "solution": 1,
+    "advice": 1,
+    "generated_story": 1,
+    "author_name": 1,
+    "created_at": 1,
+    "key_symptoms": 1,
+}
+
 class SavedStoriesDatabase:
     """Saved stories database operations"""
-    
+
     @staticmethod
     async def save_story(user_id: str, story_id: str) -> Dict[str, Any]:
         """Save a story for a user"""
         try:
-            # Check if story is already saved
-            existing = await mongodb.database.saved_stories.find_one({
-                "user_id": user_id,
-                "story_id": story_id
-            })
-            
-            if existing:
+            if not ObjectId.is_valid(story_id):
+                return {
+                    "success": False,
+                    "message": "Story not found",
+                    "not_found": True
+                }
+
+            # Snapshot the story content into the save document; approved
+            # stories are immutable, so the copy never goes stale and reads
+            # become a plain find with no join
+            story = await mongodb.database.approved_stories.find_one(
+                {"_id": ObjectId(story_id)}, _STORY_SNAPSHOT_FIELDS
+            )
+            if story is None:
+                return {
+                    "success": False,
+                    "message": "Story not found",
+                    "not_found": True
+                }
+
+            # Single upsert instead of find_one + insert_one: the unique
+            # (user_id, story_id) index makes double-saving impossible, and
+            # upserted_id tells us whether this save was new
+            result = await mongodb.database.saved_stories.update_one(
+                {"user_id": user_id, "story_id": story_id},
+                {"$setOnInsert": {"saved_at": datetime.utcnow(), "story": story}},
+                upsert=True
+            )
+
+            if result.upserted_id is None:
                 return {
                     "success": False,
                     "message": "Story already saved",
                     "already_saved": True
                 }
-            
-            # Create save record
-            save_doc = {
-                "user_id": user_id,
-                "story_id": story_id,
-                "saved_at": datetime.utcnow()
-            }
-            
-            result = await mongodb.database.saved_stories.insert_one(save_doc)
-            
+
             logger.info(f"Story {story_id} saved by user {user_id}")
-            
+
             return {
                 "success": True,
                 "message": "Story saved successfully",
-                "save_id": str(result.inserted_id)
+                "save_id": str(result.upserted_id)
             }
-            
+
         except Exception as e:
             logger.error(f"Error saving story: {e}")
             return {
@@ -85,50 +113,41 @@ class SavedStoriesDatabase:
     async def get_saved_stories(user_id: str, limit: int = 20, skip: int = 0) -> Dict[str, Any]:
         """Get user's saved stories with full story details"""
         try:
-            # Aggregation pipeline to join saved stories with actual story content
-            pipeline = [
-                {"$match": {"user_id": user_id}},
-                {"$sort": {"saved_at": -1}},
-                {"$skip": skip},
-                {"$limit": limit},
-                {
-                    "$lookup": {
-                        "from": "approved_stories",
-                        "let": {"story_id": {"$toObjectId": "$story_id"}},
-                        "pipeline": [
-                            {"$match": {"$expr": {"$eq": ["$_id", "$$story_id"]}}}
-                        ],
-                        "as": "story"
-                    }
-                },
-                {"$unwind": "$story"},
-                {
-                    "$project": {
-                        "saved_at": 1,
-                        "story_id": 1,
-                        "story._id": 1,
-                        "story.challenge": 1,
-                        "story.experience": 1,
-                        "story.solution": 1,
-                        "story.advice": 1,
-                        "story.generated_story": 1,
-                        "story.author_name": 1,
-                        "story.created_at": 1,
-                        "story.key_symptoms": 1
-                    }
-                }
-            ]
-            
-            cursor = mongodb.database.saved_stories.aggregate(pipeline)
+            # The story content is snapshotted into each save document, so
+            # this is a plain indexed find - no $lookup join per row
+            docs = await mongodb.database.saved_stories.find(
+                {"user_id": user_id}
+            ).sort("saved_at", -1).skip(skip).limit(limit).to_list(length=limit)
+
+            # Saves from before the snapshot existed still need the join;
+            # fetch those stories in one $in batch
+            legacy_ids = []
+            for doc in docs:
+                if "story" not in doc:
+                    try:
+                        legacy_ids.append(ObjectId(doc["story_id"]))
+                    except Exception:
+                        pass
+
+            legacy_stories = {}
+            if legacy_ids:
+                # Same display-field whitelist as the snapshot: internal
+                # fields (user_id, moderation metadata) must not leak
+                async for story in mongodb.database.approved_stories.find(
+                    {"_id": {"$in": legacy_ids}}, {**_STORY_SNAPSHOT_FIELDS, "_id": 1}
+                ):
+                    legacy_stories[str(story.pop("_id"))] = story
+
             saved_stories = []
-            
-            async for doc in cursor:
-                story = doc["story"]
-                story["id"] = str(story["_id"])
+            for doc in docs:
+                story = doc.get("story") or legacy_stories.get(doc["story_id"])
+                if story is None:
+                    continue  # orphaned save; cleanup will remove it
+                story = dict(story)
+                story["id"] = doc["story_id"]
                 story["saved_at"] = doc["saved_at"]
-                del story["_id"]
                 saved_stories.append(story)
-            
+
             # Get total count
             total_count = await mongodb.database.saved_stories.count_documents({"user_id": user_id})
             
@@ -161,6 +180,24 @@ class SavedStoriesDatabase:
         except Exception as e:
             logger.error(f"Error checking if story is saved: {e}")
             return False
+
+    @staticmethod
+    async def are_stories_saved(user_id: str, story_ids: List[str]) -> set:
+        """Check which of a batch of stories the user has saved"""
+        # One $in probe for a whole page of story cards instead of a
+        # round-trip per card
+        if not story_ids:
+            return set()
+        try:
+            cursor = mongodb.database.saved_stories.find(
+                {"user_id": user_id, "story_id": {"$in": story_ids}},
+                {"story_id": 1, "_id": 0}
+            ).batch_size(len(story_ids))
+            docs = await cursor.to_list(length=len(story_ids))
+            return {doc["story_id"] for doc in docs}
+        except Exception as e:
+            logger.error(f"Error checking saved stories batch: {e}")
+            return set()
     
     @staticmethod
     async def get_saved_stories_stats(user_id: str) -> Dict[str, Any]:
@@ -191,33 +228,45 @@ class SavedStoriesDatabase:
     async def cleanup_orphaned_saves():
         """Remove saves for stories that no longer exist"""
         try:
-            # Find all saved story IDs
-            saved_story_ids = []
-            async for doc in mongodb.database.saved_stories.find({}, {"story_id": 1}):
-                try:
-                    saved_story_ids.append(ObjectId(doc["story_id"]))
-                except:
-                    # Invalid ObjectId, will be cleaned up
-                    pass
-            
-            # Find which stories actually exist
-            existing_stories = []
-            async for doc in mongodb.database.approved_stories.find(
-                {"_id": {"$in": saved_story_ids}}, 
-                {"_id": 1}
-            ):
-                existing_stories.append(str(doc["_id"]))
-            
-            # Remove saves for non-existent stories
-            result = await mongodb.database.saved_stories.delete_many({
-                "story_id": {"$nin": existing_stories}
-            })
-            
-            if result.deleted_count > 0:
-                logger.info(f"Cleaned up {result.deleted_count} orphaned saved stories")
-            
-            return result.deleted_count
-            
+            # Anti-join on the server: only the _ids of orphaned saves come
+            # back over the wire, instead of shipping every story id to the
+            # client and back twice. Invalid story_ids convert to null,
+            # match nothing, and are cleaned up like any other orphan.
+            pipeline = [
+                {"$addFields": {"sid": {
+                    "$convert": {"input": "$story_id", "to": "objectId", "onError": None}
+                }}},
+                {"$lookup": {
+                    "from": "approved_stories",
+                    "localField": "sid",
+                    "foreignField": "_id",
+                    "as": "story_match",
+                    "pipeline": [{"$project": {"_id": 1}}]
+                }},
+                {"$match": {"story_match": {"$size": 0}}},
+                {"$project": {"_id": 1}},
+            ]
+
+            cursor = await mongodb.database.saved_stories.aggregate(pipeline)
+
+            # Delete in bounded batches so the $in list stays small
+            deleted_count = 0
+            batch = []
+            async for doc in cursor:
+                batch.append(doc["_id"])
+                if len(batch) >= 10000:
+                    result = await mongodb.database.saved_stories.delete_many({"_id": {"$in": batch}})
+                    deleted_count += result.deleted_count
+                    batch = []
+            if batch:
+                result = await mongodb.database.saved_stories.delete_many({"_id": {"$in": batch}})
+                deleted_count += result.deleted_count
+
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} orphaned saved stories")
+
+            return deleted_count
+
         except Exception as e:
             logger.error(f"Error cleaning up orphaned saves: {e}")
             return 0
\ No newline at end of file
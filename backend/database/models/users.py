@@ -2,6 +2,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 import secrets
 from ..connection import mongodb
 
@@ -13,10 +14,6 @@ class UserDatabase:
     @staticmethod
     async def create_user(email: str, password_hash: str, display_name: Optional[str] = None) -> Dict[str, Any]:
         """Create a new user"""
-        # Check if user exists
-        if await mongodb.database.users.find_one({"email": email}):
-            return {"success": False, "message": "Email already registered"}
-        
         user_doc = {
             "email": email,
             "password_hash": password_hash,
@@ -29,7 +26,13 @@ class UserDatabase:
             "reset_token_expires": None
         }
         
-        result = await mongodb.database.users.insert_one(user_doc)
+        # The unique index on email enforces uniqueness; no need for a
+        # read-before-insert round-trip
+        try:
+            result = await mongodb.database.users.insert_one(user_doc)
+        except DuplicateKeyError:
+            return {"success": False, "message": "Email already registered"}
+
         return {
             "success": True,
             "message": "User created successfully",
@@ -37,9 +40,9 @@ class UserDatabase:
         }
     
     @staticmethod
-    async def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
-        """Get user by email"""
-        user = await mongodb.database.users.find_one({"email": email})
+    async def get_user_by_email(email: str, projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Get user by email, optionally fetching only the fields needed"""
+        user = await mongodb.database.users.find_one({"email": email}, projection)
         if user:
             user["id"] = str(user["_id"])
             user["_id"] = str(user["_id"])
@@ -48,35 +51,35 @@ class UserDatabase:
     @staticmethod
     async def update_last_login(email: str) -> bool:
         """Update user's last login timestamp"""
+        # Server-side timestamp: no client clock skew, no datetime to encode
         result = await mongodb.database.users.update_one(
             {"email": email},
-            {"$set": {"last_login": datetime.utcnow()}}
+            {"$currentDate": {"last_login": True}}
         )
         return result.modified_count > 0
     
     @staticmethod
     async def create_password_reset_token(email: str) -> Optional[str]:
         """Generate and store a password reset token"""
-        user = await UserDatabase.get_user_by_email(email)
-        if not user:
-            return None
-        
         # Generate secure token
         reset_token = secrets.token_urlsafe(32)
         expires_at = datetime.utcnow() + timedelta(hours=1)  # 1 hour expiry
-        
-        # Store token in database
-        result = await mongodb.database.users.update_one(
+
+        # One atomic find-and-update instead of a lookup followed by a
+        # write: a single round-trip, and no race against a concurrent
+        # request for the same account
+        user = await mongodb.database.users.find_one_and_update(
             {"email": email},
             {
                 "$set": {
                     "reset_token": reset_token,
                     "reset_token_expires": expires_at
                 }
-            }
+            },
+            projection={"_id": 1}
         )
-        
-        if result.modified_count > 0:
+
+        if user is not None:
             return reset_token
         return None
     
@@ -95,29 +98,28 @@ class UserDatabase:
         return user
     
     @staticmethod
-    async def reset_password(token: str, new_password_hash: str) -> bool:
-        """Reset password using valid token"""
-        # Verify token is valid
-        user = await UserDatabase.verify_reset_token(token)
-        if not user:
-            return False
-        
-        # Update password and clear reset token
-        result = await mongodb.database.users.update_one(
-            {"_id": ObjectId(user["id"])},
+    async def reset_password(token: str, new_password_hash: str) -> Optional[Dict[str, Any]]:
+        """Reset password using valid token; returns the user or None
+
+        One atomic find_one_and_update filtered by the token itself, so
+        verification and consumption happen in a single round-trip and a
+        token can never be redeemed twice by concurrent requests.
+        """
+        return await mongodb.database.users.find_one_and_update(
             {
-                "$set": {
-                    "password_hash": new_password_hash,
-                    "last_login": datetime.utcnow()
-                },
+                "reset_token": token,
+                "reset_token_expires": {"$gt": datetime.utcnow()}
+            },
+            {
+                "$set": {"password_hash": new_password_hash},
+                "$currentDate": {"last_login": True},
                 "$unset": {
                     "reset_token": "",
                     "reset_token_expires": ""
                 }
-            }
+            },
+            projection={"email": 1}
         )
-        
-        return result.modified_count > 0
     
     @staticmethod
     async def clear_expired_reset_tokens():
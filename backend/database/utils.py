@@ -1,38 +1,125 @@
 import logging
+import re
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from .connection import mongodb
 
 logger = logging.getLogger(__name__)
 
+# Keyword lists for screening submitted content
+CRISIS_KEYWORDS = frozenset({
+    "suicide", "suicidal", "kill myself", "end my life", "end it all",
+    "want to die", "better off dead", "hurt myself", "self harm",
+    "self-harm", "overdose", "no reason to live", "hurt my baby",
+    "harm my baby",
+})
+URGENT_KEYWORDS = frozenset({
+    "hopeless", "worthless", "can't go on", "cant go on", "give up",
+    "can't cope", "cant cope", "intrusive thoughts", "panic attack",
+    "completely alone", "nobody cares",
+})
+
+_KEYWORD_CATEGORY = {
+    **{keyword: "crisis" for keyword in CRISIS_KEYWORDS},
+    **{keyword: "urgent" for keyword in URGENT_KEYWORDS},
+}
+
+# One compiled alternation instead of a Python substring loop per keyword:
+# the whole scan is a single C-level pass over the text. Longest keywords
+# first so multi-word phrases win over their substrings. Each keyword gets
+# its own group so a match maps to a bit via lastindex, letting the scan
+# accumulate hits as one integer and category tests become mask ANDs.
+_KEYWORDS = sorted(_KEYWORD_CATEGORY, key=len, reverse=True)
+_KEYWORD_PATTERN = re.compile(
+    "|".join(f"({re.escape(keyword)})" for keyword in _KEYWORDS),
+    re.IGNORECASE
+)
+_CRISIS_MASK = sum(1 << i for i, kw in enumerate(_KEYWORDS) if kw in CRISIS_KEYWORDS)
+_URGENT_MASK = sum(1 << i for i, kw in enumerate(_KEYWORDS) if kw in URGENT_KEYWORDS)
+
+# The scan is a pure function of the text, and the same story body gets
+# re-scanned on resubmission or re-review; the bitset result is a single
+# int, so only the cached key strings cost memory
+@lru_cache(maxsize=1024)
+def _scan(text: str) -> int:
+    """Scan text once, returning a bitset with one bit per matched keyword"""
+    bits = 0
+    for match in _KEYWORD_PATTERN.finditer(text):
+        bits |= 1 << (match.lastindex - 1)
+    return bits
+
+def _keywords_from_bits(bits: int) -> List[str]:
+    return [kw for i, kw in enumerate(_KEYWORDS) if bits & (1 << i)]
+
+class ContentFilter:
+    """Single-pass keyword screening for user-submitted content"""
+
+    @staticmethod
+    def check_keywords(text: str) -> Dict[str, List[str]]:
+        """Find crisis/urgent keyword hits in one pass over the text"""
+        if not text:
+            return {"crisis": [], "urgent": []}
+
+        bits = _scan(text)
+        return {
+            "crisis": _keywords_from_bits(bits & _CRISIS_MASK),
+            "urgent": _keywords_from_bits(bits & _URGENT_MASK),
+        }
+
+    @staticmethod
+    def assess_risk(text: str) -> Dict[str, Any]:
+        """Assess content risk level from keyword hits"""
+        bits = _scan(text) if text else 0
+        crisis_bits = bits & _CRISIS_MASK
+        urgent_bits = bits & _URGENT_MASK
+
+        if crisis_bits:
+            risk_level = "high"
+        elif bin(urgent_bits).count("1") >= 2:
+            risk_level = "medium"
+        elif urgent_bits:
+            risk_level = "low"
+        else:
+            risk_level = "none"
+
+        return {
+            "risk_level": risk_level,
+            "flagged_keywords": _keywords_from_bits(crisis_bits) + _keywords_from_bits(urgent_bits)
+        }
+
+# Static resource list built once at import; get_crisis_resources returns the
+# same object instead of reallocating the dicts on every request
+CRISIS_RESOURCES = [
+    {
+        "name": "National Suicide Prevention Lifeline",
+        "phone": "988",
+        "description": "24/7 free and confidential support"
+    },
+    {
+        "name": "Crisis Text Line",
+        "phone": "Text HOME to 741741",
+        "description": "24/7 crisis support via text"
+    },
+    {
+        "name": "Postpartum International Helpline",
+        "phone": "1-944-4-PSI-HELP",
+        "description": "Specialized postpartum support"
+    },
+    {
+        "name": "Emergency Services",
+        "phone": "911",
+        "description": "Immediate emergency assistance"
+    }
+]
+
 class CrisisSupport:
     """Crisis support utilities"""
-    
+
     @staticmethod
     def get_crisis_resources() -> List[Dict[str, str]]:
         """Get crisis support resources"""
-        return [
-            {
-                "name": "National Suicide Prevention Lifeline",
-                "phone": "988", 
-                "description": "24/7 free and confidential support"
-            },
-            {
-                "name": "Crisis Text Line",
-                "phone": "Text HOME to 741741",
-                "description": "24/7 crisis support via text"
-            },
-            {
-                "name": "Postpartum International Helpline", 
-                "phone": "1-944-4-PSI-HELP",
-                "description": "Specialized postpartum support"
-            },
-            {
-                "name": "Emergency Services",
-                "phone": "911",
-                "description": "Immediate emergency assistance"
-            }
-        ]
+        return CRISIS_RESOURCES
     
     @staticmethod
     async def log_crisis_interaction(interaction_type: str, user_id: Optional[str] = None) -> bool:
@@ -0,0 +1,17 @@
+# Gunicorn configuration for the containerized deployment
+#
+# Each worker is a full uvicorn event loop; the Mongo client is created in
+# the FastAPI startup event, i.e. after fork, so every worker gets its own
+# connection pool. Tune pool sizes (MONGO_MAX_POOL_SIZE) with the worker
+# count in mind: total connections = workers * maxPoolSize.
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+
+# LLM round-trips can run long; don't let gunicorn kill a worker mid-call
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
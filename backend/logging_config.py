@@ -1,82 +1,114 @@
+import atexit
 import logging
 import logging.config
 import os
-from datetime import datetime
+import queue
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pythonjsonlogger import jsonlogger
 
+# Current request id, tracked per async task so concurrent requests can't
+# stomp each other's logging context
+REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="")
+
+# Custom JSON formatter
+class CustomJsonFormatter(jsonlogger.JsonFormatter):
+    # Class constant: never rebuilt per record
+    _SERVICE = 'postnatal-stories-api'
+
+    def add_fields(self, log_record, record, message_dict):
+        super().add_fields(log_record, record, message_dict)
+        # logging already captured the record's creation time; format that
+        # instead of taking a second clock reading with utcnow()
+        log_record['timestamp'] = datetime.fromtimestamp(
+            record.created, tz=timezone.utc
+        ).isoformat()
+        log_record['level'] = record.levelname
+        log_record['service'] = self._SERVICE
+
+        # Add request ID if available (stamped by the record factory at
+        # log-call time, in the request's context - not here, since this
+        # formatter runs on the listener thread)
+        request_id = getattr(record, 'request_id', '')
+        if request_id:
+            log_record['request_id'] = request_id
+
+# Listener thread that owns the real handlers; the request path only enqueues
+_log_listener: QueueListener = None
+
 def setup_logging(log_level: str = "INFO", log_file: str = "logs/app.log"):
-    """Setup structured logging configuration"""
-    
+    """Setup structured logging configuration
+
+    All handlers sit behind a QueueListener thread, so a log call from a
+    request coroutine is a lock-free enqueue: JSON formatting, file writes
+    and rotation never block the event loop.
+    """
+    global _log_listener
+
     # Ensure logs directory exists
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
-    
-    # Custom JSON formatter
-    class CustomJsonFormatter(jsonlogger.JsonFormatter):
-        def add_fields(self, log_record, record, message_dict):
-            super(CustomJsonFormatter, self).add_fields(log_record, record, message_dict)
-            log_record['timestamp'] = datetime.utcnow().isoformat()
-            log_record['level'] = record.levelname
-            log_record['service'] = 'postnatal-stories-api'
-            
-            # Add request ID if available
-            if hasattr(record, 'request_id'):
-                log_record['request_id'] = record.request_id
-    
-    LOGGING_CONFIG = {
-        'version': 1,
-        'disable_existing_loggers': False,
-        'formatters': {
-            'json': {
-                '()': CustomJsonFormatter,
-                'format': '%(timestamp)s %(level)s %(name)s %(message)s'
-            },
-            'standard': {
-                'format': '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
-            },
-        },
-        'handlers': {
-            'console': {
-                'level': 'DEBUG',
-                'class': 'logging.StreamHandler',
-                'formatter': 'standard',
-            },
-            'file': {
-                'level': 'INFO',
-                'class': 'logging.handlers.RotatingFileHandler',
-                'filename': log_file,
-                'maxBytes': 10485760,  # 10MB
-                'backupCount': 5,
-                'formatter': 'json',
-            },
-            'error_file': {
-                'level': 'ERROR',
-                'class': 'logging.handlers.RotatingFileHandler',
-                'filename': log_file.replace('.log', '_errors.log'),
-                'maxBytes': 10485760,
-                'backupCount': 5,
-                'formatter': 'json',
-            },
-        },
-        'loggers': {
-            '': {  # root logger
-                'handlers': ['console', 'file', 'error_file'],
-                'level': log_level,
-                'propagate': False
-            },
-            'uvicorn': {
-                'handlers': ['console', 'file'],
-                'level': 'INFO',
-                'propagate': False
-            },
-            'uvicorn.access': {
-                'handlers': ['file'],
-                'level': 'INFO',
-                'propagate': False
-            },
-        }
-    }
-    
-    logging.config.dictConfig(LOGGING_CONFIG)
+
+    json_formatter = CustomJsonFormatter('%(timestamp)s %(level)s %(name)s %(message)s')
+    standard_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+    console_handler.setFormatter(standard_formatter)
+    # Access logs go to file only, as before
+    console_handler.addFilter(lambda record: record.name != 'uvicorn.access')
+
+    file_handler = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)  # 10MB
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(json_formatter)
+
+    error_file_handler = RotatingFileHandler(
+        log_file.replace('.log', '_errors.log'), maxBytes=10485760, backupCount=5
+    )
+    error_file_handler.setLevel(logging.ERROR)
+    error_file_handler.setFormatter(json_formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+
+    if _log_listener is not None:
+        _log_listener.stop()
+    _log_listener = QueueListener(
+        log_queue, console_handler, file_handler, error_file_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(log_level)
+
+    for name in ('uvicorn', 'uvicorn.access'):
+        uv_logger = logging.getLogger(name)
+        uv_logger.handlers = [queue_handler]
+        uv_logger.setLevel(logging.INFO)
+        uv_logger.propagate = False
+
+    _install_record_factory()
+
+def _install_record_factory():
+    """Install a single process-wide factory stamping the request id
+
+    Runs at log-call time in the caller's context, so the id is captured
+    before the record crosses into the listener thread.
+    """
+    base_factory = logging.getLogRecordFactory()
+    if getattr(base_factory, '_request_id_aware', False):
+        return
+
+    def record_factory(*args, **kwargs):
+        record = base_factory(*args, **kwargs)
+        record.request_id = REQUEST_ID.get()
+        return record
+
+    record_factory._request_id_aware = True
+    logging.setLogRecordFactory(record_factory)
 
 # Request ID middleware for tracing
 from fastapi import Request
@@ -86,20 +118,13 @@ async def add_request_id_middleware(request: Request, call_next):
     """Add unique request ID to each request for tracing"""
     request_id = str(uuid.uuid4())
     request.state.request_id = request_id
-    
-    # Add to logging context
-    old_factory = logging.getLogRecordFactory()
-    
-    def record_factory(*args, **kwargs):
-        record = old_factory(*args, **kwargs)
-        record.request_id = request_id
-        return record
-    
-    logging.setLogRecordFactory(record_factory)
-    
+
+    # ContextVar scoping: each async task sees its own id, with no global
+    # factory swap on the hot path
+    token = REQUEST_ID.set(request_id)
     try:
         response = await call_next(request)
         response.headers["X-Request-ID"] = request_id
         return response
     finally:
-        logging.setLogRecordFactory(old_factory)
\ No newline at end of file
+        REQUEST_ID.reset(token)
\ No newline at end of file
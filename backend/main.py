@@ -2,6 +2,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+import asyncio
+import os
 import uvicorn
 import logging
 
@@ -21,18 +24,37 @@ app = FastAPI(
     description="API for transforming recovery stories and connecting parents",
     version="3.0.0",
     docs_url="/docs" if settings.debug else None,
-    redoc_url="/redoc" if settings.debug else None
+    redoc_url="/redoc" if settings.debug else None,
+    # orjson serializes responses (incl. datetimes) in one C-level pass
+    default_response_class=ORJSONResponse
 )
 
 # Setup middleware and routes
 setup_middleware(app, settings)
 setup_routes(app, settings)
 
+# Background maintenance
+_RESET_TOKEN_SWEEP_INTERVAL = 600  # seconds
+_sweeper_task = None
+
+async def _reset_token_sweeper():
+    """Periodically clear expired password reset tokens"""
+    from database.models.users import UserDatabase
+    while True:
+        await asyncio.sleep(_RESET_TOKEN_SWEEP_INTERVAL)
+        try:
+            await UserDatabase.clear_expired_reset_tokens()
+        except Exception as e:
+            logger.warning(f"Reset token sweep failed: {e}")
+
 # Events
 @app.on_event("startup")
 async def startup_event():
+    global _sweeper_task
     await connect_to_mongo()
     logger.info("Database connected successfully")
+
+    _sweeper_task = asyncio.create_task(_reset_token_sweeper())
     
     required_vars = ["jwt_secret_key", "mongodb_uri"]
     missing_vars = [var for var in required_vars if not getattr(settings, var, None)]
@@ -52,14 +74,23 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    if _sweeper_task:
+        _sweeper_task.cancel()
     await close_mongo_connection()
     logger.info("Database connection closed")
 
 if __name__ == "__main__":
+    # uvloop and httptools ship with uvicorn[standard]; naming them
+    # explicitly fails loudly if the extras are missing instead of silently
+    # falling back to the slower asyncio loop and h11 parser. Outside debug,
+    # run the usual 2n+1 workers (reload mode is single-process anyway).
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.debug else (os.cpu_count() or 1) * 2 + 1,
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
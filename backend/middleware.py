@@ -1,10 +1,10 @@
 # Fixed middleware.py with proper CORS handling
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from logging_config import add_request_id_middleware
+from rate_limiting import limiter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,14 +16,8 @@ def setup_middleware(app: FastAPI, settings):
     app.middleware("http")(add_request_id_middleware)
     
     # CORS middleware - MUST be added early and configured properly
-    origins = []
-    if hasattr(settings, 'allowed_origins'):
-        if isinstance(settings.allowed_origins, str):
-            # Split comma-separated string
-            origins = [origin.strip() for origin in settings.allowed_origins.split(',')]
-        elif isinstance(settings.allowed_origins, list):
-            origins = settings.allowed_origins
-    
+    origins = settings.allowed_origins_list
+
     # Default origins if none specified
     if not origins:
         origins = [
@@ -95,8 +89,7 @@ def setup_middleware(app: FastAPI, settings):
         
         return response
     
-    # Rate limiting
-    limiter = Limiter(key_func=get_remote_address)
+    # Rate limiting (shared limiter; backend configured in rate_limiting.py)
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
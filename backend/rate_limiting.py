@@ -0,0 +1,20 @@
+# Shared slowapi limiter
+#
+# One limiter instance for every router instead of a fresh in-memory store
+# per module. The storage backend comes from RATE_LIMIT_STORAGE_URI (e.g.
+# redis://redis:6379) so counts are shared across gunicorn workers; the
+# default in-memory store is fine for single-process development but each
+# worker would otherwise count independently, multiplying every limit by
+# the worker count. Fixed-window costs O(1) per hit where the default
+# moving window scans O(limit) timestamps.
+import os
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy="fixed-window",
+)
@@ -7,8 +7,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Set
 from database.models.users import UserDatabase
 from services.email_service import EmailService
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from rate_limiting import limiter
 import os
 import logging
 import re
@@ -16,9 +15,6 @@ import re
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 if not SECRET_KEY or len(SECRET_KEY) < 32:
@@ -141,7 +137,12 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except JWTError:
         raise credentials_exception
     
-    user = await UserDatabase.get_user_by_email(user_email)
+    # Runs on every authenticated request: skip the credential/reset fields
+    # the handlers never read
+    user = await UserDatabase.get_user_by_email(
+        user_email,
+        projection={"password_hash": 0, "reset_token": 0, "reset_token_expires": 0}
+    )
     if user is None:
         raise credentials_exception
     return user
@@ -183,8 +184,11 @@ async def register_user(request: Request, user_data: UserCreate):
 async def login_user(request: Request, user_data: UserLogin):
     """Login user and return access token"""
     
-    user = await UserDatabase.get_user_by_email(user_data.email)
-    
+    user = await UserDatabase.get_user_by_email(
+        user_data.email,
+        projection={"reset_token": 0, "reset_token_expires": 0}
+    )
+
     if not user or not verify_password(user_data.password, user["password_hash"]):
         logger.warning(f"Failed login attempt for: {user_data.email}")
         raise HTTPException(status_code=401, detail="Incorrect email or password")
@@ -222,12 +226,14 @@ async def login_user(request: Request, user_data: UserLogin):
 @limiter.limit("3/15minutes")
 async def forgot_password(request: Request, reset_request: PasswordResetRequest):
     """Request password reset token"""
-    
-    # Clean up expired tokens first
-    await UserDatabase.clear_expired_reset_tokens()
-    
-    # Check if user exists
-    user = await UserDatabase.get_user_by_email(reset_request.email)
+
+    # Expired tokens are cleared by the periodic background sweeper, not
+    # inline on the request path
+
+    # Check if user exists; only the display name is used for the email
+    user = await UserDatabase.get_user_by_email(
+        reset_request.email, projection={"display_name": 1}
+    )
     if not user:
         # Return success even if user doesn't exist (security best practice)
         return {
@@ -262,22 +268,17 @@ async def forgot_password(request: Request, reset_request: PasswordResetRequest)
 async def reset_password(request: Request, reset_data: PasswordReset):
     """Reset password using valid token"""
     
-    # Verify token
-    user = await UserDatabase.verify_reset_token(reset_data.token)
+    # Hash new password
+    new_password_hash = get_password_hash(reset_data.new_password)
+
+    # Verify, consume and update in one atomic call
+    user = await UserDatabase.reset_password(reset_data.token, new_password_hash)
     if not user:
         raise HTTPException(
-            status_code=400, 
+            status_code=400,
             detail="Invalid or expired reset token. Please request a new password reset."
         )
-    
-    # Hash new password
-    new_password_hash = get_password_hash(reset_data.new_password)
-    
-    # Update password
-    success = await UserDatabase.reset_password(reset_data.token, new_password_hash)
-    if not success:
-        raise HTTPException(status_code=500, detail="Unable to reset password")
-    
+
     logger.info(f"Password reset successful for user: {user['email']}")
     
     return {
@@ -290,7 +291,9 @@ async def reset_password(request: Request, reset_data: PasswordReset):
 @limiter.limit("3/hour")
 async def delete_account(request: Request, deletion_request: AccountDeletionRequest):
     """Delete account immediately upon credential verification"""
-    user = await UserDatabase.get_user_by_email(deletion_request.email)
+    user = await UserDatabase.get_user_by_email(
+        deletion_request.email, projection={"password_hash": 1, "email": 1}
+    )
     if not user or not verify_password(deletion_request.password, user["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
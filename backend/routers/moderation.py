@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from database.models.moderation import ModerationDatabase
+from database.models.story import StoryDatabase
 from database.connection import mongodb
 from routers.auth import get_current_active_user
 from bson import ObjectId
 from datetime import datetime
+import asyncio
 import logging
 import traceback
 
@@ -16,6 +18,22 @@ router = APIRouter(prefix="/moderation", tags=["moderation"])
 class RejectAction(BaseModel):
     reason: Optional[str] = "Does not meet community guidelines"
 
+class BulkModerationAction(BaseModel):
+    story_ids: List[str]
+    action: str  # "approve" or "reject"
+    reason: Optional[str] = None
+
+def _review_fields(status: str, reviewer_email: str, reason: Optional[str] = None) -> dict:
+    """Shared $set shape for approve/reject moves"""
+    fields = {
+        "status": status,
+        f"{status}_by": reviewer_email,
+        f"{status}_at": datetime.utcnow(),
+    }
+    if status == "rejected":
+        fields["rejection_reason"] = reason or "Does not meet community guidelines"
+    return fields
+
 def require_moderator(current_user: dict = Depends(get_current_active_user)):
     """Require moderator or admin role"""
     if current_user.get("role") not in ["moderator", "admin"]:
@@ -26,24 +44,32 @@ def require_moderator(current_user: dict = Depends(get_current_active_user)):
 async def get_pending_stories(
     current_user: dict = Depends(require_moderator),
     limit: int = 4,
-    offset: int = 0
+    offset: int = 0,
+    risk_level: Optional[str] = None
 ):
     """Get stories pending moderation with pagination"""
-    
-    # Get total count
-    total_pending = await mongodb.database.pending_stories.count_documents({"status": "pending_review"})
-    
-    # Get limited stories
+
+    query = {"status": "pending_review"}
+    count_hint = "status_1_created_at_1"
+    if risk_level:
+        # Served by the (risk_level, status, created_at) index
+        query["risk_level"] = risk_level
+        count_hint = "risk_level_1_status_1_created_at_-1"
+
+    # Get total count; hint the index so the planner never falls back to a
+    # collection scan when the status predicate has low selectivity
+    total_pending = await mongodb.database.pending_stories.count_documents(query, hint=count_hint)
+
+    # Get limited stories in one batch instead of an await per document
     cursor = mongodb.database.pending_stories.find(
-        {"status": "pending_review"}
-    ).sort("created_at", 1).skip(offset).limit(limit)
-    
-    stories = []
-    async for story in cursor:
-        story["id"] = str(story["_id"])
-        del story["_id"]
-        stories.append(story)
-    
+        query, {"embedding": 0}
+    ).sort("created_at", 1).skip(offset).limit(limit).batch_size(limit)
+
+    stories = await cursor.to_list(length=limit)
+    for story in stories:
+        story["id"] = str(story.pop("_id"))
+
+
     return {
         "success": True,
         "pending_stories": stories,
@@ -58,8 +84,10 @@ async def get_story_details(
     current_user: dict = Depends(require_moderator)
 ):
     """Get story details for moderation"""
+    if not ObjectId.is_valid(story_id):
+        raise HTTPException(status_code=404, detail="Story not found")
     story = await mongodb.database.pending_stories.find_one({"_id": ObjectId(story_id)})
-    
+
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
     
@@ -72,21 +100,23 @@ async def approve_story(
     current_user: dict = Depends(require_moderator)
 ):
     """Approve and publish story"""
-    story = await mongodb.database.pending_stories.find_one({"_id": ObjectId(story_id)})
+    if not ObjectId.is_valid(story_id):
+        raise HTTPException(status_code=404, detail="Story not found")
+
+    try:
+        story = await ModerationDatabase.move_story(
+            story_id, "approved_stories", _review_fields("approved", current_user["email"])
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish approved story {story_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to publish story")
+
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
 
-    # Move to approved collection
-    approved_story = {
-        **story,
-        "status": "approved",
-        "approved_by": current_user["email"],
-        "approved_at": datetime.utcnow(),
-    }
+    # The newly published story should appear in the feed right away
+    StoryDatabase.invalidate_feed_cache()
 
-    await mongodb.database.approved_stories.insert_one(approved_story)
-    await mongodb.database.pending_stories.delete_one({"_id": ObjectId(story_id)})
-    
     return {
         "success": True,
         "message": "✅ Story approved and published"
@@ -95,8 +125,16 @@ async def approve_story(
 @router.get("/stats")
 async def get_moderation_stats(current_user: dict = Depends(require_moderator)):
     """Get real-time moderation statistics"""
-    total_pending = await mongodb.database.pending_stories.count_documents({"status": "pending_review"})
-    total_approved = await mongodb.database.approved_stories.count_documents({})
+    # Independent counts on two collections: dispatch both at once so the
+    # endpoint pays max(RTT) instead of the sum.
+    # The approved total is unfiltered, so the O(1) metadata count is enough;
+    # the pending count keeps count_documents because it filters on status.
+    total_pending, total_approved = await asyncio.gather(
+        mongodb.database.pending_stories.count_documents(
+            {"status": "pending_review"}, hint="status_1_created_at_1"
+        ),
+        mongodb.database.approved_stories.estimated_document_count(),
+    )
     
     return {
         "success": True,
@@ -111,53 +149,59 @@ async def reject_story(
     current_user: dict = Depends(require_moderator)
 ):
     """Reject story and move to rejected collection"""
-    try:
-        story = await mongodb.database.pending_stories.find_one({"_id": ObjectId(story_id)})
-        if not story:
-            raise HTTPException(status_code=404, detail="Story not found")
-
-        # Move to rejected collection with rejection info
-        rejected_story = {
-            **story,
-            "status": "rejected",
-            "rejected_by": current_user["email"],
-            "rejected_at": datetime.utcnow(),
-            "rejection_reason": action.reason or "Does not meet community guidelines"
-        }
+    if not ObjectId.is_valid(story_id):
+        raise HTTPException(status_code=404, detail="Story not found")
 
-        # DEBUG: Log what we're trying to insert
-        logger.info(f"Rejecting story {story_id} by {current_user['email']}")
-        logger.info(f"Rejected story user_id type: {type(rejected_story.get('user_id'))}")
-        logger.info(f"Rejected story user_id value: {rejected_story.get('user_id')}")
-
-        # Insert into rejected collection and remove from pending
-        try:
-            result = await mongodb.database.rejected_stories.insert_one(rejected_story)
-            logger.info(f"Successfully inserted rejected story with ID: {result.inserted_id}")
-            
-            # Only delete from pending if rejection insert succeeded
-            await mongodb.database.pending_stories.delete_one({"_id": ObjectId(story_id)})
-            logger.info(f"Successfully deleted story {story_id} from pending_stories")
-            
-        except Exception as db_error:
-            logger.error(f"Database error during rejection: {db_error}")
-            logger.error(f"Full traceback: {traceback.format_exc()}")
-            raise HTTPException(status_code=500, detail=f"Database error: {str(db_error)}")
-        
-        logger.info(f"Story {story_id} rejected by {current_user['email']}: {action.reason}")
-        
-        return {
-            "success": True,
-            "message": "Story rejected and moved to rejected collection"
-        }
-        
-    except HTTPException:
-        raise
+    try:
+        story = await ModerationDatabase.move_story(
+            story_id, "rejected_stories",
+            _review_fields("rejected", current_user["email"], action.reason)
+        )
     except Exception as e:
-        logger.error(f"Unexpected error rejecting story {story_id}: {e}")
+        logger.error(f"Database error during rejection of {story_id}: {e}")
         logger.error(f"Full traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail="Internal server error during rejection")
 
+    if not story:
+        raise HTTPException(status_code=404, detail="Story not found")
+
+    logger.info(f"Story {story_id} rejected by {current_user['email']}: {action.reason}")
+
+    return {
+        "success": True,
+        "message": "Story rejected and moved to rejected collection"
+    }
+
+@router.post("/bulk")
+async def bulk_moderate(
+    action: BulkModerationAction,
+    current_user: dict = Depends(require_moderator)
+):
+    """Approve or reject a batch of stories in one round-trip per operation"""
+    if action.action not in ("approve", "reject"):
+        raise HTTPException(status_code=400, detail="Action must be 'approve' or 'reject'")
+
+    status = "approved" if action.action == "approve" else "rejected"
+    destination = f"{status}_stories"
+
+    try:
+        moved = await ModerationDatabase.bulk_move_stories(
+            action.story_ids, destination,
+            _review_fields(status, current_user["email"], action.reason)
+        )
+    except Exception as e:
+        logger.error(f"Bulk {action.action} failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Bulk {action.action} failed")
+
+    if status == "approved" and moved:
+        StoryDatabase.invalidate_feed_cache()
+
+    return {
+        "success": True,
+        "message": f"{moved} stories {status}",
+        "moved_count": moved
+    }
+
 # Add this debug endpoint to check collections
 @router.get("/debug/collections")
 async def debug_collections(current_user: dict = Depends(require_moderator)):
@@ -2,19 +2,15 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from database.models.saved_stories import SavedStoriesDatabase
 from routers.auth import get_current_active_user
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from rate_limiting import limiter
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/stories/saved", tags=["saved-stories"])
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 # Models
 class SaveStoryRequest(BaseModel):
     story_id: str
@@ -24,6 +20,9 @@ class SaveStoryResponse(BaseModel):
     message: str
     is_saved: Optional[bool] = None
 
+class CheckSavedBatchRequest(BaseModel):
+    story_ids: List[str]
+
 @router.post("/save", response_model=SaveStoryResponse)
 @limiter.limit("30/minute")  # Prevent spam saving
 async def save_story(
@@ -56,9 +55,14 @@ async def save_story(
                     message="Story already in your saved collection",
                     is_saved=True
                 )
+            elif result.get("not_found"):
+                # Invalid id or story no longer published
+                raise HTTPException(status_code=404, detail="Story not found")
             else:
                 raise HTTPException(status_code=500, detail=result["message"])
-                
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in save_story endpoint: {e}")
         raise HTTPException(status_code=500, detail="Failed to save story")
@@ -201,6 +205,28 @@ async def check_story_saved(
         logger.error(f"Error checking story save status: {e}")
         raise HTTPException(status_code=500, detail="Failed to check story save status")
 
+@router.post("/check-batch")
+async def check_stories_saved(
+    check_request: CheckSavedBatchRequest,
+    current_user: dict = Depends(get_current_active_user)
+):
+    """Check saved status for a whole page of stories in one query"""
+
+    try:
+        saved_ids = await SavedStoriesDatabase.are_stories_saved(
+            user_id=current_user["id"],
+            story_ids=check_request.story_ids
+        )
+
+        return {
+            "success": True,
+            "saved_story_ids": sorted(saved_ids)
+        }
+
+    except Exception as e:
+        logger.error(f"Error checking story save status batch: {e}")
+        raise HTTPException(status_code=500, detail="Failed to check story save status")
+
 @router.get("/stats")
 async def get_saved_stories_stats(
     current_user: dict = Depends(get_current_active_user)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends, Request
 from pydantic import BaseModel
 from typing import Optional
+from datetime import datetime
 from bson import ObjectId
 from database.models.story import StoryDatabase
 from database.models.moderation import ModerationDatabase
@@ -92,27 +93,37 @@ async def submit_story_for_review(
     }
 
 @router.get("/")
-async def get_approved_stories(limit: int = 20, skip: int = 0, random: bool = True):
+async def get_approved_stories(
+    limit: int = 20,
+    skip: int = 0,
+    random: bool = True,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[str] = None,
+):
     """Get approved recovery stories"""
-    stories = await StoryDatabase.get_recovery_stories(limit=limit, skip=skip)
-    
+    stories = await StoryDatabase.get_recovery_stories(
+        limit=limit, skip=skip,
+        before_created_at=before_created_at, before_id=before_id
+    )
+
     if random and len(stories) > limit:
         import random as rand
         rand.shuffle(stories)
         stories = stories[:limit]
-    
-    # Clean sensitive data
-    for story in stories:
-        story.pop("user_id", None)
-        story.pop("moderated_by", None)
-        story.pop("moderation_notes", None)
-        story.pop("match_percentage", None)
-        story.pop("similarity_score", None)
-    
+
+    # Keyset token for the next page: cheaper than skip for deep scrolling
+    next_before = None
+    if stories:
+        last = stories[-1]
+        if last.get("created_at") is not None:
+            next_before = {"created_at": last["created_at"], "id": last["id"]}
+
+    # Sensitive fields are already projected out server-side
     return {
         "success": True,
         "stories": stories,
-        "count": len(stories)
+        "count": len(stories),
+        "next_before": next_before
     }
 
 @router.get("/{story_id}")
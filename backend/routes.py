@@ -1,6 +1,8 @@
 from fastapi import FastAPI, HTTPException, Request, Depends, APIRouter
 from pydantic import BaseModel
+import asyncio
 import logging
+import time
 from datetime import datetime
 from html import escape
 import re
@@ -11,17 +13,24 @@ from database.connection import mongodb
 from database.models.story import StoryDatabase
 from database.utils import CrisisSupport
 from backup_manager import BackupManager
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from rate_limiting import limiter
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; re.sub with inline flags re-does a cache lookup
+# (and under cache pressure a recompile) on every call
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# How long a /metrics snapshot stays fresh; scrapers typically poll every 15s
+_METRICS_CACHE_TTL = 10.0  # seconds
+
 def sanitize_user_input(text: str) -> str:
     """Sanitize user input to prevent XSS"""
     if not text:
         return ""
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _SCRIPT_RE.sub('', text)
+    text = _TAG_RE.sub('', text)
     return escape(text).strip()
 
 class SearchRequest(BaseModel):
@@ -55,33 +64,35 @@ def setup_routes(app: FastAPI, settings):
     async def list_backups(current_user: dict = Depends(get_current_active_user)):
         if current_user.get("role") != "admin":
             raise HTTPException(status_code=403, detail="Admin access required")
-        return {"backups": backup_manager.list_backups()}
+        return {"backups": await backup_manager.list_backups()}
     
     app.include_router(backup_router)
-    
-    # Rate limiter for custom routes
-    limiter = Limiter(key_func=get_remote_address)
-    
+
     # Main routes
+
+    # Settings never change after startup, so build the static payload once
+    # instead of re-reading settings attributes on every request
+    root_response = {
+        "message": "Postnatal Recovery Stories API v3.0 - Production Ready!",
+        "environment": settings.environment,
+        "features": [
+            "Recovery story transformation",
+            "Symptom extraction",
+            "Support insights",
+            "User authentication",
+            "Content moderation",
+            "Crisis support",
+            "MongoDB database storage",
+            "Structured logging",
+            "Automated backups"
+        ],
+        "security": "Enhanced security enabled",
+        "documentation": "/docs" if settings.debug else "Contact admin for API documentation"
+    }
+
     @app.get("/")
     async def root():
-        return {
-            "message": "Postnatal Recovery Stories API v3.0 - Production Ready!",
-            "environment": settings.environment,
-            "features": [
-                "Recovery story transformation",
-                "Symptom extraction", 
-                "Support insights",
-                "User authentication",
-                "Content moderation",
-                "Crisis support",
-                "MongoDB database storage",
-                "Structured logging",
-                "Automated backups"
-            ],
-            "security": "Enhanced security enabled",
-            "documentation": "/docs" if settings.debug else "Contact admin for API documentation"
-        }
+        return root_response
     
     @app.post("/search-similar")
     @limiter.limit("20/minute")
@@ -130,20 +141,37 @@ def setup_routes(app: FastAPI, settings):
             logger.error(f"Error getting stats: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
     
+    # Metrics scrapers poll frequently; serve a cached snapshot between polls
+    metrics_cache = {"payload": None, "expires": 0.0}
+
     @app.get("/metrics")
     async def get_metrics():
+        now = time.monotonic()
+        if metrics_cache["payload"] is not None and now < metrics_cache["expires"]:
+            return metrics_cache["payload"]
+
         try:
-            stats = await StoryDatabase.get_database_stats()
-            pending_stories = await mongodb.database.pending_stories.count_documents({"status": "pending_review"})
-            total_users = await mongodb.database.users.count_documents({})
-            
-            return {
+            # estimated_document_count reads collection metadata instead of
+            # scanning; the filtered pending count is pinned to its status
+            # index. All three run concurrently.
+            stats, pending_stories, total_users = await asyncio.gather(
+                StoryDatabase.get_database_stats(),
+                mongodb.database.pending_stories.count_documents(
+                    {"status": "pending_review"}, hint="status_1_created_at_1"
+                ),
+                mongodb.database.users.estimated_document_count(),
+            )
+
+            payload = {
                 "total_stories": stats.get("total_stories", 0),
                 "pending_stories": pending_stories,
                 "total_users": total_users,
                 "database_connected": stats.get("database_connected", False),
                 "timestamp": datetime.utcnow().isoformat()
             }
+            metrics_cache["payload"] = payload
+            metrics_cache["expires"] = now + _METRICS_CACHE_TTL
+            return payload
         except Exception as e:
             logger.error(f"Error getting metrics: {e}")
             return {
@@ -25,10 +25,10 @@ class EmailService:
                 reset_url = f"{frontend_url}?token={reset_token}"
             else:
                 # Fallback construction
-                if app_settings.allowed_origins[0] == "*":
+                if app_settings.allowed_origins_list[0] == "*":
                     base_url = "http://localhost:5500/frontend"
                 else:
-                    base_url = app_settings.allowed_origins[0].rstrip('/')
+                    base_url = app_settings.allowed_origins_list[0].rstrip('/')
                 reset_url = f"{base_url}/index.html?token={reset_token}"
             
             # DEBUG: Log the constructed URL
@@ -54,17 +54,17 @@ class EmailService:
                 return False
             
             # Construct reset URL
-            if app_settings.allowed_origins[0] == "*":
+            if app_settings.allowed_origins_list[0] == "*":
                 base_url = "http://127.0.0.1:5500/frontend/index.html"
             else:
-                base_url = app_settings.allowed_origins[0].rstrip('/')
+                base_url = app_settings.allowed_origins_list[0].rstrip('/')
             reset_url = f"{base_url}?token={reset_token}"
-            
+
             # Create email content
             subject = "Reset Your Password - Postnatal Stories"
             html_content = EmailService._get_html_template(user_name, reset_url, email)
             text_content = EmailService._get_text_template(user_name, reset_url)
-            
+
             # Create SendGrid mail object
             message = Mail(
                 from_email=(app_settings.email_from or "noreply@postnatalstories.com", app_settings.email_from_name),
@@ -104,10 +104,10 @@ class EmailService:
         
         try:
             # Construct reset URL
-            if app_settings.allowed_origins[0] == "*":
+            if app_settings.allowed_origins_list[0] == "*":
                 base_url = "http://127.0.0.1:5500/frontend/index.html"
             else:
-                base_url = app_settings.allowed_origins[0].rstrip('/')
+                base_url = app_settings.allowed_origins_list[0].rstrip('/')
             reset_url = f"{base_url}?token={reset_token}"
             
             # Create email content
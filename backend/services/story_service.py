@@ -2,8 +2,10 @@
 Story transformation service using Ollama models
 """
 
+import asyncio
 import logging
 import traceback
+from fastapi.concurrency import run_in_threadpool
 from .openai_client import query_openai_model, MODELS
 from database.connection import mongodb
 from typing import List, Dict
@@ -84,50 +86,66 @@ def create_story_with_embedding(story_data: dict) -> dict:
         logger.error(f"Full traceback: {traceback.format_exc()}")
         return story_data
 
-async def generate_recovery_story(
-    challenge: str, 
-    experience: str, 
-    solution: str, 
-    advice: str = "", 
-    author_name: str = "Anonymous"
-) -> dict:
-    """Generate recovery story with AI models and fallback - with embedding debugging"""
-    
-    logger.info("Starting recovery story generation")
-    
-    prompt = create_recovery_story_prompt(challenge, experience, solution, advice)
-    story = None
-    model_used = None
-    
-    # Try AI models
+async def _generate_story_text(prompt: str) -> tuple:
+    """Try each model in turn; returns (story, model_used) or (None, None)
+
+    query_openai_model uses the synchronous OpenAI client, so run it in a
+    worker thread: a multi-second completion call must not stall every
+    other request on the event loop.
+    """
     for model_name in MODELS:
         try:
-            generated_text = query_openai_model(model_name, prompt, max_tokens=300)
+            generated_text = await asyncio.to_thread(
+                query_openai_model, model_name, prompt, max_tokens=300
+            )
             if generated_text and len(generated_text.strip()) > 100:
-                story = generated_text.strip()
-                model_used = model_name
                 logger.info(f"✓ Story generated using {model_name}")
-                break
+                return generated_text.strip(), model_name
         except Exception as e:
             logger.warning(f"Model {model_name} failed: {str(e)}")
             continue
-    
+    return None, None
+
+async def _extract_key_symptoms(experience: str, feelings: str) -> List[str]:
+    """Symptom extraction leg; same blocking call, same worker-thread treatment"""
+    try:
+        from .symptom_service import extract_symptoms
+        symptom_data = await asyncio.to_thread(extract_symptoms, experience, feelings)
+        return symptom_data.get("symptoms_identified", [])[:3]
+    except Exception as e:
+        logger.warning(f"Symptom extraction failed: {e}")
+        return []
+
+async def generate_recovery_story(
+    challenge: str,
+    experience: str,
+    solution: str,
+    advice: str = "",
+    author_name: str = "Anonymous"
+) -> dict:
+    """Generate recovery story with AI models and fallback - with embedding debugging"""
+
+    logger.info("Starting recovery story generation")
+
+    prompt = create_recovery_story_prompt(challenge, experience, solution, advice)
+
+    # Story generation and symptom extraction are independent LLM
+    # round-trips over the same input, so dispatch them as one batch of
+    # parallel calls instead of serially: total latency is the slower of
+    # the two rather than their sum.
+    (story, model_used), key_symptoms = await asyncio.gather(
+        _generate_story_text(prompt),
+        _extract_key_symptoms(f"{challenge}. {experience}", advice),
+    )
+    if key_symptoms:
+        logger.info(f"Extracted symptoms: {key_symptoms}")
+
     # Fallback
     if not story or len(story.strip()) < 100:
         story = create_fallback_recovery_story(challenge, experience, solution, advice)
         model_used = "fallback"
         logger.info("Using fallback story generation")
-    
-    # Extract symptoms
-    key_symptoms = []
-    try:
-        from .symptom_service import extract_symptoms
-        symptom_data = extract_symptoms(f"{challenge}. {experience}", advice)
-        key_symptoms = symptom_data.get("symptoms_identified", [])[:3]
-        logger.info(f"Extracted symptoms: {key_symptoms}")
-    except Exception as e:
-        logger.warning(f"Symptom extraction failed: {e}")
-    
+
     # Create story data
     story_data = {
         "challenge": challenge,
@@ -141,7 +159,10 @@ async def generate_recovery_story(
     }
     
     logger.info("Creating story with embedding...")
-    story_data_with_embedding = create_story_with_embedding(story_data)
+    # Sentence-transformer inference is CPU-bound and synchronous; anyio's
+    # threadpool keeps it off the event loop and caps how many embeddings
+    # run at once
+    story_data_with_embedding = await run_in_threadpool(create_story_with_embedding, story_data)
     
     # Log embedding status
     if story_data_with_embedding.get("embedding"):
@@ -3,11 +3,57 @@ Symptom extraction service using Ollama
 """
 
 import logging
+import re
 from typing import List, Dict
 from .openai_client import query_openai_model, MODELS
 
 logger = logging.getLogger(__name__)
 
+# Symptom categories for the rule-based fallback
+SYMPTOM_KEYWORDS = {
+    "emotional": ["anxiety", "depression", "mood swings", "irritability", "crying", "overwhelmed", "guilt", "shame", "anger", "fear", "worry", "sadness", "hopeless", "panic"],
+    "physical": ["fatigue", "exhaustion", "sleep deprivation", "headaches", "muscle tension", "appetite changes", "weight changes", "pain", "weakness"],
+    "cognitive": ["brain fog", "memory problems", "concentration", "confusion", "decisions", "racing thoughts", "forgetfulness"],
+    "social": ["isolation", "loneliness", "relationship problems", "bonding", "withdrawal", "disconnected", "support"],
+    "behavioral": ["sleep problems", "eating changes", "avoiding", "perfectionism", "obsessive", "checking", "restless"]
+}
+
+_SYMPTOM_CATEGORY = {
+    keyword: category
+    for category, keywords in SYMPTOM_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# One compiled alternation instead of a substring check per keyword: the
+# whole scan is a single C-level pass over the text. Longest keywords first
+# so multi-word phrases win over their substrings.
+_SYMPTOM_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_SYMPTOM_CATEGORY, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Severity markers and concern cues share one second pattern, so the
+# severity count and key concerns come out of a single scan instead of a
+# substring check per word
+_SEVERITY_WORDS = ["exhausted", "overwhelming", "terrible", "awful", "severe", "intense"]
+_CONCERN_MAPPING = {
+    "sleep deprivation": ["sleep", "tired"],
+    "bonding difficulties": ["bond", "connect"],
+    "social isolation": ["alone", "isolated"],
+    "anxiety": ["anxious", "worry"],
+    "mood concerns": ["sad", "depressed"]
+}
+
+_AUX_KEYWORDS = {word: ("severity", word) for word in _SEVERITY_WORDS}
+for _concern, _keywords in _CONCERN_MAPPING.items():
+    for _keyword in _keywords:
+        _AUX_KEYWORDS[_keyword] = ("concern", _concern)
+
+_AUX_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_AUX_KEYWORDS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
 def create_symptom_extraction_prompt(experience: str, feelings: str) -> str:
     """Create prompt for extracting symptoms from experience"""
     return f"""You are a healthcare assistant specializing in postnatal mental health. Extract symptoms from the user's experience and feelings.
@@ -66,55 +112,36 @@ def extract_symptoms_rule_based(experience: str, feelings: str) -> Dict:
     """Rule-based symptom extraction fallback"""
     
     combined_text = f"{experience} {feelings}".lower()
-    
-    # Symptom categories
-    symptom_keywords = {
-        "emotional": ["anxiety", "depression", "mood swings", "irritability", "crying", "overwhelmed", "guilt", "shame", "anger", "fear", "worry", "sadness", "hopeless", "panic"],
-        "physical": ["fatigue", "exhaustion", "sleep deprivation", "headaches", "muscle tension", "appetite changes", "weight changes", "pain", "weakness"],
-        "cognitive": ["brain fog", "memory problems", "concentration", "confusion", "decisions", "racing thoughts", "forgetfulness"],
-        "social": ["isolation", "loneliness", "relationship problems", "bonding", "withdrawal", "disconnected", "support"],
-        "behavioral": ["sleep problems", "eating changes", "avoiding", "perfectionism", "obsessive", "checking", "restless"]
-    }
-    
+
     identified_symptoms = []
     categories_affected = []
-    
-    # Extract symptoms by category
-    for category, keywords in symptom_keywords.items():
-        category_found = False
-        for keyword in keywords:
-            if keyword in combined_text:
-                identified_symptoms.append(keyword)
-                category_found = True
-        
-        if category_found:
-            categories_affected.append(category)
-    
-    # Determine severity
-    severity_words = ["exhausted", "overwhelming", "terrible", "awful", "severe", "intense"]
-    severity_count = sum(1 for word in severity_words if word in combined_text)
-    
-    if severity_count >= 3:
+
+    # Single pass over the text instead of a substring check per keyword
+    for match in _SYMPTOM_PATTERN.finditer(combined_text):
+        keyword = match.group(0)
+        if keyword not in identified_symptoms:
+            identified_symptoms.append(keyword)
+            category = _SYMPTOM_CATEGORY[keyword]
+            if category not in categories_affected:
+                categories_affected.append(category)
+    
+    # Severity and key concerns fall out of one shared scan
+    severity_words_found = set()
+    key_concerns = []
+    for match in _AUX_PATTERN.finditer(combined_text):
+        kind, value = _AUX_KEYWORDS[match.group(0)]
+        if kind == "severity":
+            severity_words_found.add(value)
+        elif value not in key_concerns:
+            key_concerns.append(value)
+
+    if len(severity_words_found) >= 3:
         severity = ["severe"]
-    elif severity_count >= 1:
+    elif severity_words_found:
         severity = ["moderate"]
     else:
         severity = ["mild"]
     
-    # Extract key concerns
-    key_concerns = []
-    concern_mapping = {
-        "sleep deprivation": ["sleep", "tired"],
-        "bonding difficulties": ["bond", "connect"],
-        "social isolation": ["alone", "isolated"],
-        "anxiety": ["anxious", "worry"],
-        "mood concerns": ["sad", "depressed"]
-    }
-    
-    for concern, keywords in concern_mapping.items():
-        if any(keyword in combined_text for keyword in keywords):
-            key_concerns.append(concern)
-    
     return {
         "symptoms_identified": identified_symptoms[:10],
         "severity_indicators": severity,